@@ -1,95 +1,674 @@
+import fnmatch
+import itertools
+import operator
 import os
+import re
 import sys
-from typing import List
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+from typing import (
+    Callable,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Union,
+)
 import argparse
 
+# Upper bound on concurrent scans, which also caps open directory handles
+_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+# Directories modified more recently than this are not cached, since a change
+# landing within the filesystem's timestamp granularity would go unnoticed
+_CACHE_MIN_AGE_NS = 2_000_000_000
+# Maximum number of directories kept in the scan cache; the least recently
+# used entries are evicted first, so a tree with more directories than this
+# evicts its own entries before a repeated search can reuse them
+_CACHE_MAX_ENTRIES = 65536
 
-def search_file(
-    root_dir: str, target_name: str, is_case_sensitive: bool = True
+# Directory names skipped by default; they rarely hold the files being searched
+# for but often hold most of the entries in a tree
+DEFAULT_EXCLUDE_DIRS = frozenset({".git", "__pycache__", "node_modules", ".venv"})
+
+# Result of scanning one directory: matching file paths, subdirectories, and
+# symlinked subdirectories (only populated when following symlinks)
+_ScanResult = tuple[List[str], List[str], List[str]]
+
+# Per-directory scan results for searches run with use_cache=True, keyed by
+# (absolute dir, matcher key, excluded directory names, symlink following).
+# Values hold the directory mtime followed by the names in each _ScanResult
+# list. Ordered by recency of use for LRU eviction.
+_dir_hit_cache: OrderedDict[
+    tuple[str, Hashable, FrozenSet[str], bool],
+    tuple[int, List[str], List[str], List[str]],
+] = OrderedDict()
+# Guards _dir_hit_cache, which parallel searches update from worker threads
+_dir_hit_cache_lock = threading.Lock()
+
+
+class _Matcher(NamedTuple):
+    """File name predicate paired with a hashable description of it."""
+
+    # Identifies the predicate in the scan cache
+    key: Hashable
+    # Returns True for file names that should be reported
+    is_match: Callable[[str], bool]
+
+
+def _exact_matcher(target_name: str, is_case_sensitive: bool) -> _Matcher:
+    """
+    Build a matcher for a single exact file name.
+
+    Args:
+        target_name (str): Name of the file to locate.
+        is_case_sensitive (bool): Whether names are compared as-is.
+
+    Returns:
+        _Matcher: Matcher whose predicate is chosen once, so the scan loop
+        never branches on case sensitivity.
+    """
+    if is_case_sensitive:
+        # A partial of operator.eq runs the comparison without a Python frame
+        return _Matcher(("exact", target_name, True), partial(operator.eq, target_name))
+
+    # Case-fold the target name once for case-insensitive search
+    target_key = target_name.casefold()
+    return _Matcher(
+        ("exact", target_key, False), lambda name: name.casefold() == target_key
+    )
+
+
+def _pattern_matcher(
+    patterns: Union[str, Iterable[str]], is_case_sensitive: bool
+) -> _Matcher:
+    """
+    Build a matcher for one or more shell-style patterns.
+
+    All patterns are compiled into a single regular expression, so every
+    file name is tested once no matter how many patterns are given. Patterns
+    without wildcards skip the regex and compare names directly.
+
+    Case-insensitive matching case-folds both the patterns and the file
+    names, the same as _exact_matcher, so "STRASSE*.TXT" matches
+    "Straße.txt" just as "STRASSE.TXT" does.
+
+    Args:
+        patterns (Union[str, Iterable[str]]): fnmatch-style pattern or patterns.
+        is_case_sensitive (bool): Whether names are compared as-is.
+
+    Returns:
+        _Matcher: Matcher accepting names that match any of the patterns.
+
+    Raises:
+        ValueError: If no patterns are given.
+    """
+    patterns = (patterns,) if isinstance(patterns, str) else tuple(patterns)
+    if not patterns:
+        raise ValueError("At least one search pattern is required")
+
+    if not any(char in pattern for pattern in patterns for char in "*?["):
+        if len(patterns) == 1:
+            return _exact_matcher(patterns[0], is_case_sensitive)
+        if is_case_sensitive:
+            names = frozenset(patterns)
+            return _Matcher(("names", names, True), names.__contains__)
+        names = frozenset(pattern.casefold() for pattern in patterns)
+        return _Matcher(("names", names, False), lambda name: name.casefold() in names)
+
+    if is_case_sensitive:
+        regex = re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
+        return _Matcher(("glob", patterns, True), regex.match)
+
+    # re.IGNORECASE only compares single characters, so fold both sides
+    # instead to match multi-character foldings such as "ß" -> "ss"
+    folded = tuple(pattern.casefold() for pattern in patterns)
+    regex = re.compile("|".join(fnmatch.translate(pattern) for pattern in folded))
+    return _Matcher(
+        ("glob", folded, False), lambda name: regex.match(name.casefold()) is not None
+    )
+
+
+def _scan_directory(
+    current_dir: str,
+    matcher: _Matcher,
+    exclude_dirs: FrozenSet[str],
+    follow_symlinks: bool,
+) -> _ScanResult:
+    """
+    Scan a single directory for the target file.
+
+    Args:
+        current_dir (str): Directory to scan.
+        matcher (_Matcher): Predicate selecting the files to report.
+        exclude_dirs (FrozenSet[str]): Names of subdirectories not to descend into.
+        follow_symlinks (bool): Whether to descend into symlinked directories.
+
+    Returns:
+        _ScanResult: Paths of matching files, of real subdirectories and of
+        symlinked subdirectories still to be searched. The last list is
+        always empty unless follow_symlinks is set.
+
+    Raises:
+        PermissionError: If the directory cannot be read.
+        OSError: If the directory cannot be scanned for any other reason.
+    """
+    located_paths = []
+    subdirs = []
+    linked_subdirs = []
+
+    # Iterate over directory entries; scandir reuses the entry type reported
+    # by the OS instead of issuing a stat() per item
+    #
+    # Directories are opened by path rather than through os.fwalk: CPython's
+    # fwalk adds an fstatat() and an fstat() per directory on top of the same
+    # scandir, and as a generator it cannot hand single directories to the
+    # scan cache or the thread pool.
+    #
+    # The predicate was specialized when the matcher was built, so the loop
+    # below has no per-entry branch on case sensitivity or pattern kind
+    is_match = matcher.is_match
+    with os.scandir(current_dir) as entries:
+        for entry in entries:
+            # is_file() only stats entries that are symlinks, so linked files
+            # are reported without costing a syscall for regular entries
+            if entry.is_file():
+                if is_match(entry.name):
+                    located_paths.append(entry.path)
+            elif entry.is_dir(follow_symlinks=follow_symlinks):
+                if entry.name not in exclude_dirs:
+                    # is_symlink() reuses the entry type, so this costs no syscall
+                    if follow_symlinks and entry.is_symlink():
+                        linked_subdirs.append(entry.path)
+                    else:
+                        subdirs.append(entry.path)
+
+    return located_paths, subdirs, linked_subdirs
+
+
+def _cached_scan(
+    current_dir: str,
+    matcher: _Matcher,
+    exclude_dirs: FrozenSet[str],
+    follow_symlinks: bool,
+    stat_result: Optional[os.stat_result] = None,
+) -> _ScanResult:
+    """
+    Scan a directory, reusing an earlier result if the directory is unchanged.
+
+    A cached entry is valid while the directory's mtime matches the one
+    recorded before it was scanned; adding, removing or renaming an entry
+    updates the mtime and forces a rescan. Checking the mtime costs a stat()
+    per directory, so this is only used when a search opts in with use_cache.
+
+    Args:
+        current_dir (str): Directory to scan.
+        matcher (_Matcher): Predicate selecting the files to report.
+        exclude_dirs (FrozenSet[str]): Names of subdirectories not to descend into.
+        follow_symlinks (bool): Whether to descend into symlinked directories.
+        stat_result (Optional[os.stat_result]): Stat of current_dir already
+            taken by the caller, reused instead of calling os.stat again.
+
+    Returns:
+        _ScanResult: Matching file paths, subdirectories and symlinked
+        subdirectories.
+
+    Raises:
+        PermissionError: If the directory cannot be read.
+        OSError: If the directory cannot be scanned for any other reason.
+    """
+    cache_key = (
+        os.path.abspath(current_dir), matcher.key, exclude_dirs, follow_symlinks
+    )
+    if stat_result is None:
+        stat_result = os.stat(current_dir)
+    mtime_ns = stat_result.st_mtime_ns
+
+    with _dir_hit_cache_lock:
+        cached = _dir_hit_cache.get(cache_key)
+        if cached is not None:
+            _dir_hit_cache.move_to_end(cache_key)
+
+    if cached is not None and cached[0] == mtime_ns:
+        return tuple(
+            [os.path.join(current_dir, name) for name in names] for names in cached[1:]
+        )
+
+    scan_result = _scan_directory(current_dir, matcher, exclude_dirs, follow_symlinks)
+
+    if time.time_ns() - mtime_ns > _CACHE_MIN_AGE_NS:
+        # Store names rather than paths so hits can be rebuilt for any
+        # spelling of current_dir (relative, absolute, trailing separator)
+        entry = (mtime_ns,) + tuple(
+            [os.path.basename(path) for path in paths] for paths in scan_result
+        )
+        with _dir_hit_cache_lock:
+            _dir_hit_cache[cache_key] = entry
+            _dir_hit_cache.move_to_end(cache_key)
+            while len(_dir_hit_cache) > _CACHE_MAX_ENTRIES:
+                _dir_hit_cache.popitem(last=False)
+
+    return scan_result
+
+
+def _safe_scan(
+    current_dir: str,
+    stat_result: Optional[os.stat_result],
+    matcher: _Matcher,
+    exclude_dirs: FrozenSet[str],
+    follow_symlinks: bool,
+    use_cache: bool,
+) -> _ScanResult:
+    """
+    Scan a directory, reporting access problems as warnings instead of raising.
+
+    Args:
+        current_dir (str): Directory to scan.
+        stat_result (Optional[os.stat_result]): Stat of current_dir if the
+            walker already took one, otherwise None.
+        matcher (_Matcher): Predicate selecting the files to report.
+        exclude_dirs (FrozenSet[str]): Names of subdirectories not to descend into.
+        follow_symlinks (bool): Whether to descend into symlinked directories.
+        use_cache (bool): Whether to go through the scan cache.
+
+    Returns:
+        _ScanResult: Matching file paths, subdirectories and symlinked
+        subdirectories, all empty if the directory could not be read.
+    """
+    try:
+        if use_cache:
+            return _cached_scan(
+                current_dir, matcher, exclude_dirs, follow_symlinks, stat_result
+            )
+        return _scan_directory(current_dir, matcher, exclude_dirs, follow_symlinks)
+    except PermissionError:
+        print(f"Warning: Permission denied accessing directory: {current_dir}")
+    except Exception as err:
+        print(f"Warning: Error while searching in directory {current_dir}: {err}")
+    return [], [], []
+
+
+def _first_visit(
+    directory: str, visited: Optional[Set[tuple[int, int]]]
+) -> tuple[bool, Optional[os.stat_result]]:
+    """
+    Record a directory by device and inode, reporting whether it is new.
+
+    Args:
+        directory (str): Directory about to be scanned.
+        visited (Optional[Set[tuple[int, int]]]): Identities of directories
+            already scanned, or None when symlinks are not followed and no
+            directory can be reached twice.
+
+    Returns:
+        tuple[bool, Optional[os.stat_result]]: False if the directory was
+        already scanned through another path, and the stat taken to decide
+        (None if no stat was needed) so the scan can reuse it.
+    """
+    if visited is None:
+        return True, None
+    try:
+        stat_result = os.stat(directory)
+    except OSError:
+        # Let the scan itself report the problem
+        return True, None
+    identity = (stat_result.st_dev, stat_result.st_ino)
+    if identity in visited:
+        return False, stat_result
+    visited.add(identity)
+    return True, stat_result
+
+
+def _iter_serial(
+    start_dirs: List[str],
+    start_links: List[str],
+    scan: Callable[[str, Optional[os.stat_result]], _ScanResult],
+    visited: Optional[Set[tuple[int, int]]],
+) -> Iterator[str]:
+    """
+    Search the given directories depth-first on the calling thread.
+
+    Symlinked directories are deferred until no real directory is left, so a
+    directory reachable both directly and through a link is reported under
+    its real path.
+
+    Args:
+        start_dirs (List[str]): Directories to search, in visiting order.
+        start_links (List[str]): Symlinked directories to search afterwards.
+        scan (Callable): Returns the matching files, subdirectories and
+            symlinked subdirectories of a directory.
+        visited (Optional[Set[tuple[int, int]]]): Identities of directories
+            already scanned, tracked only when following symlinks.
+
+    Yields:
+        str: Path of each matching file as soon as its directory is scanned.
+    """
+    # Depth-first traversal driven by an explicit stack of directories
+    stack = list(reversed(start_dirs))
+    deferred_links = deque(start_links)
+
+    while stack or deferred_links:
+        current_dir = stack.pop() if stack else deferred_links.popleft()
+        is_new, stat_result = _first_visit(current_dir, visited)
+        if not is_new:
+            continue
+        found_paths, subdirs, linked_subdirs = scan(current_dir, stat_result)
+        yield from found_paths
+        # Push in reverse so subdirectories are visited in scan order
+        stack.extend(reversed(subdirs))
+        deferred_links.extend(linked_subdirs)
+
+
+def _iter_parallel(
+    start_dirs: List[str],
+    start_links: List[str],
+    scan: Callable[[str, Optional[os.stat_result]], _ScanResult],
+    visited: Optional[Set[tuple[int, int]]],
+) -> Iterator[str]:
+    """
+    Search the given directories using a pool of worker threads.
+
+    Each directory is scanned as a separate task; os.scandir releases the GIL
+    while waiting on the filesystem, so scans overlap their I/O. This only
+    pays off when metadata latency is high (network or cold filesystems); on
+    a warm local tree the thread handoff makes it slower than _iter_serial,
+    which is why it is opt-in. Results are collected and new directories
+    checked against visited on the calling thread, so no locking is needed.
+    Symlinked directories are only started once no real directory is
+    pending, as in _iter_serial. Closing the generator early cancels every
+    scan that has not started yet.
+
+    Args:
+        start_dirs (List[str]): Directories to search.
+        start_links (List[str]): Symlinked directories to search afterwards.
+        scan (Callable): Returns the matching files, subdirectories and
+            symlinked subdirectories of a directory.
+        visited (Optional[Set[tuple[int, int]]]): Identities of directories
+            already scanned, tracked only when following symlinks.
+
+    Yields:
+        str: Path of each matching file, in completion order, which varies
+        from run to run.
+    """
+    deferred_links = deque(start_links)
+
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+
+        def submit_new(directories: Iterable[str]) -> Iterator[Future]:
+            for directory in directories:
+                is_new, stat_result = _first_visit(directory, visited)
+                if is_new:
+                    yield executor.submit(scan, directory, stat_result)
+
+        pending = set(submit_new(start_dirs))
+        try:
+            while pending or deferred_links:
+                if not pending:
+                    pending.update(submit_new([deferred_links.popleft()]))
+                    continue
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    found_paths, subdirs, linked_subdirs = future.result()
+                    # Queue subdirectories before yielding so workers stay busy
+                    pending.update(submit_new(subdirs))
+                    deferred_links.extend(linked_subdirs)
+                    yield from found_paths
+        finally:
+            for queued in pending:
+                queued.cancel()
+
+
+def _iter_matches(
+    root_dir: str,
+    matcher: _Matcher,
+    exclude_dirs: FrozenSet[str],
+    follow_symlinks: bool,
+    parallel: bool,
+    use_cache: bool,
+) -> Iterator[str]:
+    """
+    Lazily yield every matching file below root_dir.
+
+    Symlinked directories are only entered when follow_symlinks is set; each
+    directory is then recorded by (st_dev, st_ino) so links pointing back up
+    the tree, or at a directory already searched, are not walked again. Links
+    are walked after the real tree, so the real path of a directory wins.
+
+    Args:
+        root_dir (str): Existing directory to start searching from.
+        matcher (_Matcher): Predicate selecting the files to report.
+        exclude_dirs (FrozenSet[str]): Names of subdirectories not to descend into.
+        follow_symlinks (bool): Whether to descend into symlinked directories.
+        parallel (bool): Whether to scan subdirectories on a thread pool.
+        use_cache (bool): Whether to reuse cached scans of unchanged directories.
+
+    Yields:
+        str: Full path of each matching file.
+    """
+    scan = partial(
+        _safe_scan,
+        matcher=matcher,
+        exclude_dirs=exclude_dirs,
+        follow_symlinks=follow_symlinks,
+        use_cache=use_cache,
+    )
+    visited = set() if follow_symlinks else None
+    _, stat_result = _first_visit(root_dir, visited)
+
+    found_paths, subdirs, linked_subdirs = scan(root_dir, stat_result)
+    yield from found_paths
+
+    walk = _iter_parallel if parallel else _iter_serial
+    yield from walk(subdirs, linked_subdirs, scan, visited)
+
+
+def _resolve_exclude_dirs(exclude_dirs: Optional[Iterable[str]]) -> FrozenSet[str]:
+    """
+    Apply the default prune set and freeze the names for use as a cache key.
+
+    Args:
+        exclude_dirs (Optional[Iterable[str]]): Caller supplied names, or None.
+
+    Returns:
+        FrozenSet[str]: Directory names to skip during the search.
+    """
+    if exclude_dirs is None:
+        return DEFAULT_EXCLUDE_DIRS
+    return frozenset(exclude_dirs)
+
+
+def _search(
+    root_dir: str,
+    matcher: _Matcher,
+    exclude_dirs: FrozenSet[str],
+    follow_symlinks: bool,
+    parallel: bool,
+    use_cache: bool,
+    limit: Optional[int],
 ) -> tuple[List[str], int]:
     """
-    Performs a recursive search for a specific file within a given directory.
+    Validate the search root and collect files accepted by the matcher.
 
     Args:
         root_dir (str): Directory to start searching from.
-        target_name (str): Name of the file to locate.
-        is_case_sensitive (bool): If True, search is case-sensitive (default: True).
+        matcher (_Matcher): Predicate selecting the files to report.
+        exclude_dirs (FrozenSet[str]): Names of subdirectories not to descend into.
+        follow_symlinks (bool): Whether to descend into symlinked directories.
+        parallel (bool): Whether to scan subdirectories on a thread pool.
+        use_cache (bool): Whether to reuse cached scans of unchanged directories.
+        limit (Optional[int]): If set, stop searching once this many matches
+            are found.
 
     Returns:
-        tuple[List[str], int]: A tuple with:
-            - A list of full file paths where the target file was located.
-            - Total count of occurrences found.
+        tuple[List[str], int]: Matching file paths and their count.
 
     Raises:
         FileNotFoundError: If the provided directory path does not exist.
-        PermissionError: If access to a directory is restricted.
+        NotADirectoryError: If the provided path is not a directory.
+        ValueError: If limit is not a positive integer.
     """
+    if limit is not None and limit < 1:
+        raise ValueError(f"limit must be a positive integer, got {limit}")
+
     if not os.path.exists(root_dir):
         raise FileNotFoundError(f"Specified directory does not exist: {root_dir}")
 
     if not os.path.isdir(root_dir):
         raise NotADirectoryError(f"Path is not a directory: {root_dir}")
 
-    def _recursive_find(current_dir: str) -> tuple[List[str], int]:
-        """
-        Internal function to recursively search files in directories.
+    # Matches are streamed into a single list; stopping at the limit closes
+    # the generator so no further directories are scanned
+    matches = _iter_matches(
+        root_dir, matcher, exclude_dirs, follow_symlinks, parallel, use_cache
+    )
+    try:
+        located_paths = list(itertools.islice(matches, limit))
+    finally:
+        matches.close()
 
-        Args:
-            current_dir (str): The current directory in the recursion.
+    return located_paths, len(located_paths)
 
-        Returns:
-            tuple[List[str], int]: Accumulated paths found and count in subdirectories.
-        """
-        located_paths = []
-        file_count = 0
 
-        try:
-            # Retrieve directory entries
-            items = os.listdir(current_dir)
-
-            # Adjust the target name if case-insensitive search is enabled
-            search_target = target_name.lower() if not is_case_sensitive else target_name
-
-            # Iterate over each item in the directory
-            for item in items:
-                full_item_path = os.path.join(current_dir, item)
-
-                # Check if it's a file and matches the target name
-                if os.path.isfile(full_item_path):
-                    item_name = item.lower() if not is_case_sensitive else item
-                    if item_name == search_target:
-                        located_paths.append(full_item_path)
-                        file_count += 1
-
-                # If a directory, continue recursion
-                elif os.path.isdir(full_item_path):
-                    try:
-                        nested_paths, nested_count = _recursive_find(full_item_path)
-                        located_paths.extend(nested_paths)
-                        file_count += nested_count
-                    except PermissionError:
-                        print(
-                            f"Warning: No permission to access directory: {full_item_path}"
-                        )
-                    except Exception as err:
-                        print(f"Warning: Error accessing directory {full_item_path}: {err}")
-
-        except PermissionError:
-            print(f"Warning: Permission denied accessing directory: {current_dir}")
-        except Exception as err:
-            print(
-                f"Warning: Error while searching in directory {current_dir}: {err}"
-            )
+def search_files(
+    root_dir: str,
+    patterns: Union[str, List[str]],
+    is_case_sensitive: bool = True,
+    limit: Optional[int] = None,
+    exclude_dirs: Optional[FrozenSet[str]] = None,
+    follow_symlinks: bool = False,
+    parallel: bool = False,
+    use_cache: bool = False,
+) -> tuple[List[str], int]:
+    """
+    Performs a recursive search for files matching shell-style patterns.
 
-        return located_paths, file_count
+    The tree is walked once regardless of how many patterns are given.
 
-    # Initialize recursive search from root directory
-    return _recursive_find(root_dir)
+    Args:
+        root_dir (str): Directory to start searching from.
+        patterns (Union[str, List[str]]): fnmatch-style pattern, or list of
+            patterns, such as "*.log" or ["*.txt", "data_??.csv"].
+        is_case_sensitive (bool): If True, search is case-sensitive (default: True).
+        limit (Optional[int]): If set, stop searching once this many matches
+            are found (default: None, search the whole tree).
+        exclude_dirs (Optional[FrozenSet[str]]): Names of directories not to
+            descend into (default: None, use DEFAULT_EXCLUDE_DIRS). Pass an
+            empty set to search every directory.
+        follow_symlinks (bool): If True, descend into symlinked directories;
+            each directory is still searched only once, so symlink cycles are
+            safe. Symlinked files are matched either way (default: False).
+        parallel (bool): If True, scan directories on a thread pool. This can
+            help on high-latency filesystems but is slower on warm local
+            trees. Results then come back in completion order, so the order,
+            and which files are returned when limit is set, can differ
+            between runs (default: False).
+        use_cache (bool): If True, remember each directory's scan and reuse it
+            on later searches while the directory's mtime is unchanged. This
+            adds a stat() per directory, so it only helps when the same tree
+            is searched repeatedly. The cache holds at most
+            _CACHE_MAX_ENTRIES directories (default: False).
 
+    Returns:
+        tuple[List[str], int]: A tuple with:
+            - A list of full file paths matching any of the patterns.
+            - Total count of matching files.
 
-def run_search():
+    Raises:
+        FileNotFoundError: If the provided directory path does not exist.
+        NotADirectoryError: If the provided path is not a directory.
+        ValueError: If no patterns are given or limit is not a positive integer.
     """
-    Parse command-line arguments and initiate the file search.
+    return _search(
+        root_dir,
+        _pattern_matcher(patterns, is_case_sensitive),
+        _resolve_exclude_dirs(exclude_dirs),
+        follow_symlinks,
+        parallel,
+        use_cache,
+        limit,
+    )
+
+
+def search_file(
+    root_dir: str,
+    target_name: str,
+    is_case_sensitive: bool = True,
+    limit: Optional[int] = None,
+    exclude_dirs: Optional[FrozenSet[str]] = None,
+    follow_symlinks: bool = False,
+    parallel: bool = False,
+    use_cache: bool = False,
+) -> tuple[List[str], int]:
+    """
+    Performs a recursive search for a specific file within a given directory.
+
+    Args:
+        root_dir (str): Directory to start searching from.
+        target_name (str): Exact name of the file to locate; wildcard
+            characters are matched literally.
+        is_case_sensitive (bool): If True, search is case-sensitive (default: True).
+        limit (Optional[int]): If set, stop searching once this many matches
+            are found (default: None, search the whole tree).
+        exclude_dirs (Optional[FrozenSet[str]]): Names of directories not to
+            descend into (default: None, use DEFAULT_EXCLUDE_DIRS). Pass an
+            empty set to search every directory.
+        follow_symlinks (bool): If True, descend into symlinked directories;
+            each directory is still searched only once, so symlink cycles are
+            safe. Symlinked files are matched either way (default: False).
+        parallel (bool): If True, scan directories on a thread pool. This can
+            help on high-latency filesystems but is slower on warm local
+            trees. Results then come back in completion order, so the order,
+            and which files are returned when limit is set, can differ
+            between runs (default: False).
+        use_cache (bool): If True, remember each directory's scan and reuse it
+            on later searches while the directory's mtime is unchanged. This
+            adds a stat() per directory, so it only helps when the same tree
+            is searched repeatedly. The cache holds at most
+            _CACHE_MAX_ENTRIES directories (default: False).
+
+    Returns:
+        tuple[List[str], int]: A tuple with:
+            - A list of full file paths where the target file was located.
+            - Total count of occurrences found.
+
+    Raises:
+        FileNotFoundError: If the provided directory path does not exist.
+        NotADirectoryError: If the provided path is not a directory.
+        ValueError: If limit is not a positive integer.
+    """
+    return _search(
+        root_dir,
+        _exact_matcher(target_name, is_case_sensitive),
+        _resolve_exclude_dirs(exclude_dirs),
+        follow_symlinks,
+        parallel,
+        use_cache,
+        limit,
+    )
+
+
+def _cache_clear() -> None:
+    """Drop every cached directory scan."""
+    with _dir_hit_cache_lock:
+        _dir_hit_cache.clear()
+
+
+search_file.cache_clear = _cache_clear
+search_files.cache_clear = _cache_clear
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command-line parser for run_search.
+
+    Returns:
+        argparse.ArgumentParser: Parser for the file search arguments.
     """
     parser = argparse.ArgumentParser(
         description="Perform a recursive search for a specific file"
@@ -102,19 +681,67 @@ def run_search():
         action="store_true",
         help="Enable case-insensitive file search",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--first",
+        action="store_true",
+        help="Stop at the first match instead of searching the whole tree",
+    )
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        default=[],
+        metavar="DIR_NAME",
+        help="Skip directories with this name (repeatable)",
+    )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Scan directories on a thread pool (result order may vary)",
+    )
+    parser.add_argument(
+        "--follow-symlinks",
+        action="store_true",
+        help="Descend into symlinked directories (each directory is searched once)",
+    )
+    parser.add_argument(
+        "--no-default-excludes",
+        action="store_true",
+        help=f"Also search {', '.join(sorted(DEFAULT_EXCLUDE_DIRS))}",
+    )
+    return parser
+
+
+# Built once so repeated programmatic calls to run_search reuse it
+_PARSER = _build_parser()
+
+
+def run_search():
+    """
+    Parse command-line arguments and initiate the file search.
+    """
+    args = _PARSER.parse_args()
+
+    exclude_dirs = set(args.exclude)
+    if not args.no_default_excludes:
+        exclude_dirs |= DEFAULT_EXCLUDE_DIRS
 
     try:
         found_files, total_found = search_file(
-            args.root_dir, args.target_name, is_case_sensitive=not args.case_insensitive
+            args.root_dir,
+            args.target_name,
+            is_case_sensitive=not args.case_insensitive,
+            limit=1 if args.first else None,
+            exclude_dirs=frozenset(exclude_dirs),
+            follow_symlinks=args.follow_symlinks,
+            parallel=args.parallel,
         )
 
         if found_files:
             print(
                 f"\nLocated {total_found} instance(s) of '{args.target_name}' in these locations:"
             )
-            for path in found_files:
-                print(f"- {path}")
+            # Emit every path with a single write instead of one print per path
+            sys.stdout.write("".join(f"- {path}\n" for path in found_files))
         else:
             print(f"\nNo instances of '{args.target_name}' found in '{args.root_dir}'")
 
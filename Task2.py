@@ -1,5 +1,122 @@
-from typing import List
-import time
+from typing import Callable, Iterator, List
+import itertools
+import math
+import timeit
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # numba (and numpy) are optional
+    np = None
+    njit = None
+
+# Number of timed runs per method; the fastest run is reported
+_TIMING_REPEATS = 5
+
+
+def _iter_distinct_permutations(source_string: str) -> Iterator[str]:
+    """
+    Yield each distinct permutation of a string once, in lexicographic order.
+
+    Starting from the sorted characters, every step rewrites the buffer into
+    the next larger arrangement, so repeated characters never produce the same
+    permutation twice and only n! / (m1! * m2! * ...) results are generated.
+
+    Args:
+        source_string (str): Non-empty input string.
+
+    Yields:
+        str: The next distinct permutation.
+    """
+    chars = sorted(source_string)
+    last = len(chars) - 1
+
+    while True:
+        yield "".join(chars)
+
+        # Find the rightmost position that can still be increased
+        pivot = last - 1
+        while pivot >= 0 and chars[pivot] >= chars[pivot + 1]:
+            pivot -= 1
+        if pivot < 0:
+            return
+
+        # Swap in the smallest larger character from the suffix, then reset
+        # the suffix to its smallest (ascending) arrangement
+        successor = last
+        while chars[successor] <= chars[pivot]:
+            successor -= 1
+        chars[pivot], chars[successor] = chars[successor], chars[pivot]
+        chars[pivot + 1:] = reversed(chars[pivot + 1:])
+
+
+def iter_permutations(source_string: str, unique: bool = False) -> Iterator[str]:
+    """
+    Lazily yield all permutations of a given string.
+
+    Only one permutation is held in memory at a time, so callers that stream
+    or count results avoid materializing all n! strings.
+
+    Args:
+        source_string (str): The input string to generate permutations for.
+        unique (bool): Whether to skip duplicate permutations. Distinct
+            permutations are produced directly, in lexicographic order.
+
+    Returns:
+        Iterator[str]: Iterator over all permutations.
+
+    Raises:
+        ValueError: If the input string is empty.
+    """
+    # Error handling for empty input, raised eagerly rather than on first next()
+    if not source_string:
+        raise ValueError("Input string cannot be empty")
+
+    if unique:
+        if len(set(source_string)) < len(source_string):
+            return _iter_distinct_permutations(source_string)
+        # Without repeated characters every permutation is already distinct;
+        # permuting the sorted characters keeps the lexicographic order
+        return map("".join, itertools.permutations(sorted(source_string)))
+
+    # itertools.permutations yields the same order as choosing each character
+    # as the first one and recursing, but runs the recursion in C
+    return map("".join, itertools.permutations(source_string))
+
+
+def _iter_heap_permutations(source_string: str) -> Iterator[str]:
+    """
+    Lazily yield all permutations of a string using Heap's algorithm.
+
+    Each permutation differs from the previous one by a single swap in a
+    mutable character buffer, so no substrings are sliced along the way.
+    A counter per position replaces the recursion.
+
+    Args:
+        source_string (str): Non-empty input string.
+
+    Yields:
+        str: The next permutation, in Heap's order.
+    """
+    chars = list(source_string)
+    size = len(chars)
+    counters = [0] * size
+
+    yield "".join(chars)
+
+    position = 1
+    while position < size:
+        if counters[position] < position:
+            # Even positions swap with the first element, odd ones with the
+            # element selected by the counter
+            swap_index = counters[position] if position % 2 else 0
+            chars[swap_index], chars[position] = chars[position], chars[swap_index]
+            yield "".join(chars)
+            counters[position] += 1
+            position = 1
+        else:
+            counters[position] = 0
+            position += 1
 
 
 def create_permutations(
@@ -18,33 +135,81 @@ def create_permutations(
     Raises:
         ValueError: If the input string is empty.
     """
-    # Error handling for empty input
-    if not source_string:
-        raise ValueError("Input string cannot be empty")
+    return list(iter_permutations(source_string, unique))
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _permutations_njit(codes, total):
+        """
+        Compiled Heap's algorithm over an array of character codes.
+
+        Args:
+            codes (np.ndarray): 1-D array of character codes.
+            total (int): Number of permutations, len(codes) factorial.
+
+        Returns:
+            np.ndarray: Array of shape (total, len(codes)), one permutation
+            per row.
+        """
+        size = codes.shape[0]
+        output = np.empty((total, size), dtype=codes.dtype)
+        buffer = codes.copy()
+        counters = np.zeros(size, dtype=np.int64)
+
+        output[0, :] = buffer
+        row = 1
+        position = 1
+        while position < size:
+            if counters[position] < position:
+                swap_index = counters[position] if position % 2 else 0
+                held = buffer[swap_index]
+                buffer[swap_index] = buffer[position]
+                buffer[position] = held
+                output[row, :] = buffer
+                row += 1
+                counters[position] += 1
+                position = 1
+            else:
+                counters[position] = 0
+                position += 1
+
+        return output
+
+
+def create_permutations_fast(source_string: str) -> List[str]:
+    """
+    Generate all permutations of a string with a numba-compiled kernel.
 
-    # Base case: single character string
-    if len(source_string) == 1:
-        return [source_string]
+    The string is encoded as an array of code points, permuted by a JIT
+    compiled Heap's algorithm and decoded back row by row. Falls back to
+    create_permutations when numba is not installed.
 
-    result_permutations = []
-    # Try each character as the first character
-    for index in range(len(source_string)):
-        # Get the current character
-        current_char = source_string[index]
-        # Get the remaining characters
-        remaining_chars = source_string[:index] + source_string[index + 1:]
+    Args:
+        source_string (str): The input string to generate permutations for.
 
-        # Recursively generate permutations of remaining characters
-        sub_permutations = create_permutations(remaining_chars)
+    Returns:
+        List[str]: List of all permutations, in Heap's order when compiled.
+
+    Raises:
+        ValueError: If the input string is empty.
+    """
+    if not source_string:
+        raise ValueError("Input string cannot be empty")
 
-        # Add current character to the beginning of each sub-permutation
-        for sub_perm in sub_permutations:
-            result_permutations.append(current_char + sub_perm)
+    if njit is None:
+        return create_permutations(source_string)
 
-    # Remove duplicates if specified
-    if unique:
-        return list(set(result_permutations))
-    return result_permutations
+    size = len(source_string)
+    codes = np.array([ord(char) for char in source_string], dtype=np.uint32)
+    rows = _permutations_njit(codes, math.factorial(size))
+
+    # numpy's str dtype strips trailing NUL characters, so only strings
+    # without NUL can reuse the rows' UCS-4 layout directly
+    if "\x00" in source_string:
+        return ["".join(map(chr, row)) for row in rows.tolist()]
+    return rows.view(f"U{size}").ravel().tolist()
 
 
 def create_permutations_iteratively(
@@ -70,23 +235,40 @@ def create_permutations_iteratively(
     permutations_list = [source_string[0]]
 
     # Process each remaining character
-    for index in range(1, len(source_string)):
-        new_permutations = []
-        current_char = source_string[index]
+    for current_char in source_string[1:]:
+        # Every existing permutation has the same length
+        slot_count = len(permutations_list[0]) + 1
 
         # Insert current character at each possible position in existing permutations
-        for perm in permutations_list:
-            for position in range(len(perm) + 1):
-                new_perm = perm[:position] + current_char + perm[position:]
-                new_permutations.append(new_perm)
+        permutations_list = [
+            perm[:position] + current_char + perm[position:]
+            for perm in permutations_list
+            for position in range(slot_count)
+        ]
 
-        permutations_list = new_permutations
+        # Drop duplicates every round so repeats never multiply further
+        if unique:
+            permutations_list = list(dict.fromkeys(permutations_list))
 
-    if unique:
-        return list(set(permutations_list))
     return permutations_list
 
 
+def _best_duration(func: Callable[[], object]) -> float:
+    """
+    Time a callable several times and return the fastest run.
+
+    timeit uses time.perf_counter, a monotonic high-resolution clock, and the
+    minimum filters out runs slowed down by unrelated system activity.
+
+    Args:
+        func (Callable[[], object]): Zero-argument callable to time.
+
+    Returns:
+        float: Duration of the fastest run in seconds.
+    """
+    return min(timeit.repeat(func, repeat=_TIMING_REPEATS, number=1))
+
+
 def evaluate_performance(source_string: str):
     """
     Compare performance between recursive and iterative approaches.
@@ -95,18 +277,37 @@ def evaluate_performance(source_string: str):
         source_string (str): Input string to test with.
     """
     # Measure recursive performance
-    start_time = time.time()
-    recursive_output = create_permutations(source_string)
-    recursive_duration = time.time() - start_time
+    recursive_duration = _best_duration(lambda: create_permutations(source_string))
 
     # Measure iterative performance
-    start_time = time.time()
+    iterative_duration = _best_duration(
+        lambda: create_permutations_iteratively(source_string)
+    )
+
+    # Measure streaming performance, counting without building a list
+    streaming_duration = _best_duration(
+        lambda: sum(1 for _ in iter_permutations(source_string))
+    )
+
+    # Measure Heap's algorithm against the itertools-based stream above
+    heap_duration = _best_duration(
+        lambda: sum(1 for _ in _iter_heap_permutations(source_string))
+    )
+
+    # Measure the numba kernel; the first call compiles it, so warm it up
+    create_permutations_fast(source_string)
+    compiled_duration = _best_duration(lambda: create_permutations_fast(source_string))
+
+    recursive_output = create_permutations(source_string)
     iterative_output = create_permutations_iteratively(source_string)
-    iterative_duration = time.time() - start_time
 
-    print(f"\nPerformance evaluation for string '{source_string}':")
+    print(f"\nPerformance evaluation for string '{source_string}' (best of {_TIMING_REPEATS}):")
     print(f"Recursive method: {recursive_duration:.6f} seconds")
     print(f"Iterative method: {iterative_duration:.6f} seconds")
+    print(f"Streaming method: {streaming_duration:.6f} seconds")
+    print(f"Heap's method: {heap_duration:.6f} seconds")
+    compiled_note = "" if njit is not None else " (numba unavailable)"
+    print(f"Compiled method{compiled_note}: {compiled_duration:.6f} seconds")
     print(f"Total permutations generated: {len(recursive_output)}")
     print(f"Outputs match: {sorted(recursive_output) == sorted(iterative_output)}")
 
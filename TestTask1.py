@@ -2,8 +2,10 @@ import unittest
 import os
 import tempfile
 import shutil
+from unittest import mock
 from pathlib import Path
-from Task1 import search_file  # Make sure to import the search_file function
+import Task1
+from Task1 import search_file, search_files  # Make sure to import the search functions
 
 
 class TestFileSearcher(unittest.TestCase):
@@ -81,6 +83,7 @@ class TestFileSearcher(unittest.TestCase):
     def tearDown(self):
         """Remove the temporary directory after tests have run."""
         shutil.rmtree(self.base_dir)
+        search_file.cache_clear()
 
     def test_basic_file_search(self):
         """Test basic functionality of file searching in the root directory."""
@@ -111,6 +114,41 @@ class TestFileSearcher(unittest.TestCase):
         normalized_paths = [os.path.normpath(p) for p in found_paths]
         self.assertTrue(any(path == hidden_path for path in normalized_paths))
 
+    def test_pattern_search(self):
+        """Test searching with shell-style patterns in a single pass."""
+        found_paths, count = search_files(self.base_dir, "*.txt", is_case_sensitive=True)
+        self.assertEqual(count, 8)
+
+        found_paths, count = search_files(self.base_dir, ["file1.*", "file3.txt"], is_case_sensitive=True)
+        self.assertEqual(count, 5)
+
+        found_paths, count = search_files(self.base_dir, "FILE1.TXT", is_case_sensitive=False)
+        self.assertEqual(count, 5)
+
+        with self.assertRaises(ValueError):
+            search_files(self.base_dir, [])
+
+    def test_excluded_directories(self):
+        """Test that excluded directories are not searched."""
+        git_dir = os.path.join(self.base_dir, ".git")
+        os.makedirs(git_dir)
+        with open(os.path.join(git_dir, "file3.txt"), "w") as f:
+            f.write("git file3")
+
+        # .git is pruned by default
+        found_paths, count = search_file(self.base_dir, "file3.txt", is_case_sensitive=True)
+        self.assertEqual(count, 1)
+
+        found_paths, count = search_file(
+            self.base_dir, "file3.txt", is_case_sensitive=True, exclude_dirs=frozenset()
+        )
+        self.assertEqual(count, 2)
+
+        found_paths, count = search_file(
+            self.base_dir, "file1.txt", is_case_sensitive=True, exclude_dirs=frozenset({"folder4"})
+        )
+        self.assertEqual(count, 2)
+
     def test_nonexistent_path(self):
         """Test behavior when searching in a nonexistent directory."""
         with self.assertRaises(FileNotFoundError):
@@ -127,6 +165,20 @@ class TestFileSearcher(unittest.TestCase):
         self.assertEqual(count, 0)
         self.assertEqual(len(found_paths), 0)
 
+    def test_case_insensitive_unicode(self):
+        """Test case-insensitive search uses full Unicode case folding."""
+        with open(os.path.join(self.base_dir, "Straße.txt"), "w") as f:
+            f.write("unicode name")
+
+        found_paths, count = search_file(self.base_dir, "STRASSE.TXT", is_case_sensitive=False)
+        self.assertEqual(count, 1)
+        self.assertTrue(found_paths[0].endswith("Straße.txt"))
+
+        # Patterns fold the same way as exact names
+        found_paths, count = search_files(self.base_dir, "STRASSE*.TXT", is_case_sensitive=False)
+        self.assertEqual(count, 1)
+        self.assertTrue(found_paths[0].endswith("Straße.txt"))
+
     def test_special_filenames(self):
         """Test handling of filenames that contain special characters."""
         # Create a file with special characters
@@ -158,6 +210,176 @@ class TestFileSearcher(unittest.TestCase):
             # Skip if the platform does not support symlinks
             self.skipTest("Symbolic links not supported on this platform")
 
+    def test_symlinked_file_found(self):
+        """Test that a symlink to a file is matched with default arguments."""
+        link_path = os.path.join(self.base_dir, "folder4", "link.txt")
+        try:
+            os.symlink(os.path.join(self.base_dir, "file1.txt"), link_path)
+        except (OSError, NotImplementedError):
+            self.skipTest("Symbolic links not supported on this platform")
+
+        for follow_symlinks in (False, True):
+            with self.subTest(follow_symlinks=follow_symlinks):
+                found_paths, count = search_file(
+                    self.base_dir,
+                    "link.txt",
+                    is_case_sensitive=True,
+                    follow_symlinks=follow_symlinks,
+                )
+                self.assertEqual(count, 1)
+                self.assertEqual(found_paths, [link_path])
+
+    def test_wide_tree_search(self):
+        """Test searching a wide tree serially and on the thread pool."""
+        wide_root = os.path.join(self.base_dir, "wide")
+        for i in range(10):
+            nested_dir = os.path.join(wide_root, f"dir{i}", "nested")
+            os.makedirs(nested_dir)
+            with open(os.path.join(nested_dir, "file1.txt"), "w") as f:
+                f.write(f"wide file1 {i}")
+
+        serial_paths, count = search_file(wide_root, "file1.txt", is_case_sensitive=True)
+        self.assertEqual(count, 10)
+
+        parallel_paths, count = search_file(
+            wide_root, "file1.txt", is_case_sensitive=True, parallel=True
+        )
+        self.assertEqual(count, 10)
+        self.assertEqual(sorted(parallel_paths), sorted(serial_paths))
+
+    def test_repeated_search_sees_changes(self):
+        """Test that cached directory scans are reused and invalidated on change."""
+        # Backdate the directory so its scan result is eligible for caching
+        old_time_ns = 1_000_000_000_000_000_000
+        os.utime(self.base_dir, ns=(old_time_ns, old_time_ns))
+
+        # Without opting in, nothing is cached
+        search_file(self.base_dir, "file1.txt", is_case_sensitive=True)
+        self.assertEqual(len(Task1._dir_hit_cache), 0)
+
+        first_paths, first_count = search_file(
+            self.base_dir, "file1.txt", is_case_sensitive=True, use_cache=True
+        )
+        self.assertEqual(len(Task1._dir_hit_cache), 1)
+
+        # The second search must be served from the cache for the root
+        with mock.patch("os.scandir", wraps=os.scandir) as scandir_mock:
+            second_paths, second_count = search_file(
+                self.base_dir, "file1.txt", is_case_sensitive=True, use_cache=True
+            )
+        scanned_dirs = [call.args[0] for call in scandir_mock.call_args_list]
+        self.assertNotIn(self.base_dir, scanned_dirs)
+        self.assertEqual(first_count, second_count)
+        self.assertEqual(sorted(first_paths), sorted(second_paths))
+
+        # Removing an entry updates the mtime, so the cached scan must be discarded
+        os.remove(os.path.join(self.base_dir, "file1.txt"))
+        found_paths, count = search_file(
+            self.base_dir, "file1.txt", is_case_sensitive=True, use_cache=True
+        )
+        self.assertEqual(count, first_count - 1)
+
+    def test_cache_is_bounded(self):
+        """Test that the scan cache evicts old entries beyond its size limit."""
+        old_time_ns = 1_000_000_000_000_000_000
+        for dirpath, _, _ in os.walk(self.base_dir):
+            os.utime(dirpath, ns=(old_time_ns, old_time_ns))
+
+        with mock.patch.object(Task1, "_CACHE_MAX_ENTRIES", 2):
+            search_file(self.base_dir, "file1.txt", is_case_sensitive=True, use_cache=True)
+        self.assertEqual(len(Task1._dir_hit_cache), 2)
+
+    def test_search_with_limit(self):
+        """Test that the search stops once the requested number of matches is found."""
+        found_paths, count = search_file(self.base_dir, "file1.txt", is_case_sensitive=True, limit=1)
+        self.assertEqual(count, 1)
+        self.assertTrue(found_paths[0].endswith("file1.txt"))
+
+        found_paths, count = search_file(self.base_dir, "file1.txt", is_case_sensitive=True, limit=3)
+        self.assertEqual(count, 3)
+        self.assertEqual(len(set(found_paths)), 3)
+
+        with self.assertRaises(ValueError):
+            search_file(self.base_dir, "file1.txt", limit=0)
+
+    def test_symlink_cycle(self):
+        """Test that a symlink pointing back to an ancestor does not loop forever."""
+        try:
+            os.symlink(
+                self.base_dir,
+                os.path.join(self.base_dir, "folder1", "folder2", "loop"),
+                target_is_directory=True,
+            )
+            os.symlink(
+                os.path.join(self.base_dir, "folder4"),
+                os.path.join(self.base_dir, "alias_to_folder4"),
+                target_is_directory=True,
+            )
+        except (OSError, NotImplementedError):
+            self.skipTest("Symbolic links not supported on this platform")
+
+        # Symlinked directories are not followed by default
+        found_paths, count = search_file(self.base_dir, "file1.txt", is_case_sensitive=True)
+        self.assertEqual(count, 4)
+
+        # When following, every directory is still searched exactly once
+        found_paths, count = search_file(
+            self.base_dir, "file1.txt", is_case_sensitive=True, follow_symlinks=True
+        )
+        self.assertEqual(count, 4)
+
+    def test_symlink_reports_real_path(self):
+        """Test that a directory reachable through a link is reported by its real path."""
+        try:
+            # Create the link in several places so scandir order cannot decide
+            for holder in ("aaa", "folder1", "zzz"):
+                os.makedirs(os.path.join(self.base_dir, holder), exist_ok=True)
+                os.symlink(
+                    os.path.join(self.base_dir, "folder4"),
+                    os.path.join(self.base_dir, holder, "link_to_folder4"),
+                    target_is_directory=True,
+                )
+        except (OSError, NotImplementedError):
+            self.skipTest("Symbolic links not supported on this platform")
+
+        real_path = os.path.join(self.base_dir, "folder4", "file1.txt")
+        for parallel in (False, True):
+            with self.subTest(parallel=parallel):
+                found_paths, count = search_file(
+                    self.base_dir,
+                    "file1.txt",
+                    is_case_sensitive=True,
+                    follow_symlinks=True,
+                    parallel=parallel,
+                )
+                self.assertEqual(count, 4)
+                self.assertIn(real_path, found_paths)
+                self.assertFalse(any("link_to_folder4" in path for path in found_paths))
+
+    def test_symlink_follow_stats_once(self):
+        """Test that following symlinks with the cache stats each directory once."""
+        try:
+            os.symlink(
+                os.path.join(self.base_dir, "folder1"),
+                os.path.join(self.base_dir, "folder4", "link_to_folder1"),
+                target_is_directory=True,
+            )
+        except (OSError, NotImplementedError):
+            self.skipTest("Symbolic links not supported on this platform")
+
+        with mock.patch("os.stat", wraps=os.stat) as stat_mock:
+            search_file(
+                self.base_dir,
+                "file1.txt",
+                is_case_sensitive=True,
+                follow_symlinks=True,
+                use_cache=True,
+            )
+        stat_paths = [call.args[0] for call in stat_mock.call_args_list]
+        # The root is also checked by the existence validation in _search
+        nested_paths = [path for path in stat_paths if path != self.base_dir]
+        self.assertEqual(len(nested_paths), len(set(nested_paths)))
+
     def test_permission_issues(self):
         """Test handling of permission denied errors."""
         restricted_dir = os.path.join(self.base_dir, "restricted_folder")
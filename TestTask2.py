@@ -0,0 +1,84 @@
+import unittest
+import itertools
+import Task2
+from Task2 import (
+    _iter_distinct_permutations,
+    _iter_heap_permutations,
+    create_permutations,
+    create_permutations_fast,
+    create_permutations_iteratively,
+)
+
+
+def all_permutations(source_string):
+    """Reference result: every permutation, duplicates included, sorted."""
+    return sorted(map("".join, itertools.permutations(source_string)))
+
+
+def distinct_permutations(source_string):
+    """Reference result: each distinct permutation once, sorted."""
+    return sorted(set(map("".join, itertools.permutations(source_string))))
+
+
+class TestPermutations(unittest.TestCase):
+    """Unit tests for the permutation generators."""
+
+    # Inputs with repeated characters, without repeats, and non-ASCII
+    SAMPLES = ["A", "AB", "ABCD", "AAB", "AABB", "ABCA", "héllo", "ßüß", "日本日"]
+
+    def test_distinct_permutations(self):
+        """Test that repeated characters yield each permutation exactly once."""
+        for sample in self.SAMPLES:
+            with self.subTest(sample=sample):
+                generated = list(_iter_distinct_permutations(sample))
+                self.assertEqual(generated, distinct_permutations(sample))
+
+    def test_unique_permutations(self):
+        """Test unique=True on both the recursive and iterative functions."""
+        for sample in self.SAMPLES:
+            with self.subTest(sample=sample):
+                expected = distinct_permutations(sample)
+                self.assertEqual(create_permutations(sample, unique=True), expected)
+                self.assertEqual(
+                    sorted(create_permutations_iteratively(sample, unique=True)), expected
+                )
+
+    def test_heap_permutations(self):
+        """Test that Heap's algorithm produces every permutation once."""
+        for sample in self.SAMPLES:
+            with self.subTest(sample=sample):
+                generated = list(_iter_heap_permutations(sample))
+                self.assertEqual(sorted(generated), all_permutations(sample))
+                self.assertEqual(sorted(set(generated)), distinct_permutations(sample))
+
+    def test_fast_permutations(self):
+        """Test the compiled generator (or its fallback) against itertools."""
+        for sample in self.SAMPLES:
+            with self.subTest(sample=sample):
+                generated = create_permutations_fast(sample)
+                self.assertEqual(sorted(generated), all_permutations(sample))
+                self.assertEqual(sorted(set(generated)), distinct_permutations(sample))
+
+    @unittest.skipIf(Task2.njit is None, "numba is not installed")
+    def test_fast_permutations_compiled(self):
+        """Test the numba kernel itself, including NUL characters."""
+        for sample in self.SAMPLES + ["\x00A", "A\x00\x00", "\x00\x00B\x00"]:
+            with self.subTest(sample=sample):
+                generated = create_permutations_fast(sample)
+                self.assertEqual(generated, list(_iter_heap_permutations(sample)))
+                self.assertEqual(sorted(generated), all_permutations(sample))
+
+    def test_empty_string(self):
+        """Test that every public generator rejects an empty string."""
+        for function in (
+            create_permutations,
+            create_permutations_iteratively,
+            create_permutations_fast,
+        ):
+            with self.subTest(function=function.__name__):
+                with self.assertRaises(ValueError):
+                    function("")
+
+
+if __name__ == "__main__":
+    unittest.main()